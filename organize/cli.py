@@ -30,6 +30,18 @@ def main():
         action="store_true",
         help="Restore files to original locations using log file"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of files to hash in parallel, 0 to pick from the CPU count "
+             "(default: 1, best for HDDs)"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only print warnings, not every moved file"
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -42,7 +54,7 @@ def main():
         if args.restore:
             restore(args.folder)
         else:
-            organize(args.folder, dry_run=args.dry_run)
+            organize(args.folder, dry_run=args.dry_run, jobs=args.jobs, quiet=args.quiet)
             
     except KeyboardInterrupt:
         print("\n❌ Operation cancelled by user")
@@ -1,8 +1,198 @@
-import os, shutil, hashlib, json
+import os, re, sys, shutil, hashlib, json, mmap, errno
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from .filetypes import FILE_TYPES
 
+try:
+    import blake3
+except ImportError:  # optional, installed with organize-cli[fast]
+    blake3 = None
+
 LOG_FILE = ".organize_log.json"
+CACHE_FILE = ".organize_cache.json"
+_SKIP_NAMES = frozenset((LOG_FILE, CACHE_FILE))
+CHUNK_SIZE = 1 << 20  # 1 MiB reads keep per-chunk Python overhead negligible
+PREFIX_SIZE = 4096
+MMAP_THRESHOLD = 4 << 20  # files this large are hashed from a memory map
+
+# Reverse index of FILE_TYPES so category() is a single dict lookup. Keys are
+# lowercased, as category() lowercases the extension it looks up, and keys and
+# names are interned so every lookup and every file shares one copy of each.
+EXT_TO_CAT = {
+    sys.intern(ext.lower()): sys.intern(cat)
+    for cat, exts in FILE_TYPES.items()
+    for ext in exts
+}
+
+# Python 3.11+ can hash a file object entirely in C, with no per-chunk
+# Python loop; older versions fall back to reading CHUNK_SIZE blocks.
+_HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+# copy_file_range() errors meaning "not possible here", not a failed copy
+_COPY_FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name) for name in ("EXDEV", "ENOSYS", "EINVAL", "EOPNOTSUPP", "ENOTSUP")
+    if hasattr(errno, name)
+)
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+# Algorithm behind _content_hash(), recorded in the hash cache
+HASH_ALGORITHM = "blake3" if blake3 is not None else "sha256"
+
+
+def _scan(root):
+    """
+    Recursively yield the files below a directory.
+    
+    Behaves like os.walk(): files in a directory are yielded before those
+    in its subdirectories, symlinked directories are not followed and
+    directories that cannot be listed are skipped. Yielding os.DirEntry
+    objects lets callers reuse the full path and stat() without extra
+    os.path.join() or os.stat() calls.
+    
+    Args:
+        root (str): Directory to scan
+        
+    Yields:
+        os.DirEntry: Entry for each file found
+    """
+    stack = [root]
+    while stack:
+        top = stack.pop()
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(top) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry)
+                        continue
+                    try:
+                        is_symlink = entry.is_symlink()
+                    except OSError:
+                        is_symlink = True
+                    if not is_symlink:
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+
+        yield from files
+        stack.extend(reversed(subdirs))
+
+
+def _collect(folder, out):
+    """
+    Scan a folder once and gather everything organize() needs per file.
+    
+    Args:
+        folder (str): Folder to scan
+        out (_Output): Where to report files that cannot be stat'ed
+        
+    Returns:
+        tuple: (entries, skipped) where entries is a list of
+        (path, name, size, dev, ino, mtime_ns, ctime_ns) tuples in scan order and
+        skipped counts the files that could not be stat'ed
+    """
+    entries = []
+    skipped = 0
+
+    for entry in _scan(folder):
+        if entry.name in _SKIP_NAMES:
+            continue
+
+        try:
+            st = entry.stat()
+        except OSError as e:
+            out.warn(f"⚠ Skipped {entry.path}: {str(e)}")
+            skipped += 1
+            continue
+
+        entries.append(
+            (entry.path, entry.name, st.st_size, st.st_dev, st.st_ino,
+             st.st_mtime_ns, st.st_ctime_ns)
+        )
+
+    return entries, skipped
+
+
+def _mmap_sha256(f):
+    """
+    Hash an open file through a read-only memory map.
+    
+    The whole mapping is passed to a single update() call, so pages go
+    straight from the page cache to the hash without being copied into
+    Python buffers.
+    
+    Args:
+        f (file): File opened in binary mode
+        
+    Returns:
+        str: Hexadecimal SHA-256 hash, or None if the file cannot be mapped
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    with mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return hashlib.sha256(mm).hexdigest()
+
+
+def _sha256_file(f, size):
+    """
+    Hash an open file, picking the fastest method available for its size.
+    
+    Args:
+        f (file): File opened in binary mode, possibly unbuffered
+        size (int): Size of the file in bytes
+        
+    Returns:
+        str: Hexadecimal SHA-256 hash
+    """
+    if size >= MMAP_THRESHOLD:
+        digest = _mmap_sha256(f)
+        if digest is not None:
+            return digest
+    if _HAS_FILE_DIGEST:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+    # Reuse one buffer, no larger than the file; slicing the memoryview
+    # avoids a new bytes per chunk. Files reporting size 0 (/proc, /sys,
+    # some FUSE mounts) can still hold data, so they get a full chunk
+    h = hashlib.sha256()
+    buf = bytearray(min(size, CHUNK_SIZE) or CHUNK_SIZE)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        h.update(view[:n])
+    return h.hexdigest()
+
+
+def _fadvise(f, advice):
+    """
+    Give the kernel an access-pattern hint for a whole open file.
+    
+    Does nothing on platforms without os.posix_fadvise (Windows, macOS).
+    
+    Args:
+        f (file): Open file
+        advice (str): Name of an os.POSIX_FADV_* constant
+    """
+    if not _HAS_FADVISE:
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+    except OSError:
+        pass
 
 
 def sha256(path):
@@ -20,46 +210,570 @@ def sha256(path):
         PermissionError: If file cannot be read
         IOError: If there's an error reading the file
     """
-    if not os.path.exists(path):
+    # open() reports missing and unreadable files itself, so there are no
+    # separate exists()/access() checks costing a syscall each per file
+    try:
+        # Reads are already large, so skip io.BufferedReader's extra copy
+        with open(path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            # Read-ahead hints only pay off for files needing several reads
+            if size <= CHUNK_SIZE:
+                return _sha256_file(f, size)
+            _fadvise(f, "POSIX_FADV_SEQUENTIAL")
+            try:
+                return _sha256_file(f, size)
+            finally:
+                # Each file is read once; don't let it evict useful cached pages
+                _fadvise(f, "POSIX_FADV_DONTNEED")
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {path}")
-    
-    if not os.access(path, os.R_OK):
+    except PermissionError:
         raise PermissionError(f"Cannot read file: {path} (permission denied)")
+    except IOError as e:
+        raise IOError(f"Error reading file {path}: {str(e)}")
+
+
+def prefix_hash(path, n=PREFIX_SIZE):
+    """
+    Calculate SHA-256 hash of the first bytes of a file.
+    
+    Files whose prefixes differ cannot be duplicates, so this serves as a
+    cheap filter before hashing whole files. For files no larger than n
+    bytes the result equals sha256(path).
     
+    Args:
+        path (str): Path to the file
+        n (int): Number of leading bytes to hash
+        
+    Returns:
+        str: Hexadecimal SHA-256 hash of the first n bytes
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file cannot be read
+        IOError: If there's an error reading the file
+    """
     try:
-        h = hashlib.sha256()
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
+            return hashlib.sha256(f.read(n)).hexdigest()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}")
+    except PermissionError:
+        raise PermissionError(f"Cannot read file: {path} (permission denied)")
+    except IOError as e:
+        raise IOError(f"Error reading file {path}: {str(e)}")
+
+
+def _auto_jobs():
+    """
+    Pick a hashing thread count for fast storage.
+    
+    Hashing threads spend nearly all their time in GIL-free reads and
+    hashlib updates, so several per CPU keep an SSD's queue busy.
+    
+    Returns:
+        int: Number of hashing threads to use
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _content_hash(path):
+    """
+    Hash a whole file for duplicate detection.
+    
+    Duplicate detection only needs to know whether two files are
+    identical, so when the optional blake3 package is installed its SIMD,
+    multithreaded hashing is used instead of SHA-256.
+    
+    Args:
+        path (str): Path to the file
+        
+    Returns:
+        str: Hexadecimal digest using HASH_ALGORITHM
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file cannot be read
+        IOError: If there's an error reading the file
+    """
+    if blake3 is None:
+        return sha256(path)
+
+    try:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(path).hexdigest()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}")
+    except PermissionError:
+        raise PermissionError(f"Cannot read file: {path} (permission denied)")
+    except IOError as e:
+        raise IOError(f"Error reading file {path}: {str(e)}")
+
+
+def _same_content(a, b, size=CHUNK_SIZE):
+    """
+    Compare two files byte by byte.
+    
+    Stops at the first chunk that differs, so two unrelated files of the
+    same size usually cost one read each instead of two full hashes.
+    
+    Args:
+        a (str): Path to the first file
+        b (str): Path to the second file
+        size (int): Expected size of the files, so small files don't get
+            full-sized read buffers
+        
+    Returns:
+        bool: True if both files hold the same bytes
+        
+    Raises:
+        FileNotFoundError: If either file doesn't exist
+        PermissionError: If either file cannot be read
+        IOError: If there's an error reading either file
+    """
+    path = a
+    try:
+        with open(a, "rb") as fa:
+            path = b
+            with open(b, "rb") as fb:
+                bufsize = max(1, min(size, CHUNK_SIZE))
+                buf_a = bytearray(bufsize)
+                buf_b = bytearray(bufsize)
+                while True:
+                    path = a
+                    n = fa.readinto(buf_a)
+                    path = b
+                    if fb.readinto(buf_b) != n:
+                        return False
+                    if not n:
+                        return True
+                    if n < bufsize:
+                        return buf_a[:n] == buf_b[:n]
+                    if buf_a != buf_b:
+                        return False
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}")
+    except PermissionError:
+        raise PermissionError(f"Cannot read file: {path} (permission denied)")
     except IOError as e:
         raise IOError(f"Error reading file {path}: {str(e)}")
 
 
+def _hash_paths(hash_func, paths, jobs=1):
+    """
+    Hash several files, in parallel when more than one job is allowed.
+    
+    hashlib releases the GIL while digesting large buffers and file reads
+    release it too, so threads overlap I/O and hashing across files.
+    
+    Args:
+        hash_func (callable): Function mapping a path to its hash
+        paths (list): Paths to hash
+        jobs (int): Maximum number of files hashed at once
+        
+    Returns:
+        list: (path, digest, error) tuples in the order of paths, where
+        exactly one of digest and error is None
+    """
+    def attempt(path):
+        try:
+            return path, hash_func(path), None
+        except (FileNotFoundError, PermissionError, IOError) as e:
+            return path, None, e
+
+    if jobs > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(attempt, paths))
+    return [attempt(path) for path in paths]
+
+
+def _cache_key(size, dev, ino, mtime_ns, ctime_ns):
+    """
+    Build the hash cache key identifying one version of a file.
+    
+    The inode change time is included because, unlike the modification
+    time, tools cannot set it: a file rewritten in place with its old
+    mtime restored, or a new file reusing a freed inode, still gets a new
+    ctime and so a new key.
+    
+    Args:
+        size (int): File size in bytes
+        dev (int): Device the file lives on (st_dev)
+        ino (int): Inode number of the file (st_ino)
+        mtime_ns (int): Modification time in nanoseconds
+        ctime_ns (int): Inode change time in nanoseconds
+        
+    Returns:
+        str: Cache key, or None when the platform reports no inode number
+        (os.DirEntry.stat() on Windows), as the key would not be unique
+    """
+    if not ino:
+        return None
+    return f"{dev}:{ino}:{size}:{mtime_ns}:{ctime_ns}"
+
+
+def _current_digests(entries, keys, moved):
+    """
+    Collect the digests worth caching once organizing has finished.
+    
+    Renaming a file changes its ctime, so files that were moved are
+    stat'ed again at their new path; deleted duplicates are left out.
+    
+    Args:
+        entries (list): Entry tuples from _collect()
+        keys (dict): Content keys from _dedupe_keys()
+        moved (dict): Maps the index of each moved file to its new path,
+            or to None if it was deleted as a duplicate
+        
+    Returns:
+        dict: Mapping of cache key to hex digest
+    """
+    digests = {}
+    for i, key in keys.items():
+        if not isinstance(key, str):
+            continue
+        size, dev, ino, mtime_ns, ctime_ns = entries[i][2:]
+        if i in moved:
+            if moved[i] is None:
+                continue
+            try:
+                st = os.stat(moved[i])
+            except OSError:
+                continue
+            dev, ino, mtime_ns, ctime_ns = st.st_dev, st.st_ino, st.st_mtime_ns, st.st_ctime_ns
+        ckey = _cache_key(size, dev, ino, mtime_ns, ctime_ns)
+        if ckey is not None:
+            digests[ckey] = key
+    return digests
+
+
+def _load_cache(path):
+    """
+    Read digests saved by a previous run.
+    
+    Args:
+        path (str): Path to the cache file
+        
+    Returns:
+        dict: Mapping of cache key to hex digest; empty if the file is
+        missing, unreadable, not in the expected format or written with a
+        different HASH_ALGORITHM
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("algorithm") != HASH_ALGORITHM:
+        return {}
+    digests = data.get("digests")
+    return digests if isinstance(digests, dict) else {}
+
+
+def _save_cache(path, digests, out):
+    """
+    Save digests for the next run.
+    
+    Args:
+        path (str): Path to the cache file
+        digests (dict): Mapping of cache key to hex digest
+        out (_Output): Where to report write errors
+    """
+    try:
+        with open(path, "w") as f:
+            json.dump({"algorithm": HASH_ALGORITHM, "digests": digests}, f)
+    except (IOError, OSError) as e:
+        out.warn(f"⚠ Warning: Could not write hash cache: {str(e)}")
+
+
+def _dedupe_keys(entries, jobs=1, cache=None):
+    """
+    Compute content keys for files that may have duplicates.
+    
+    Files are narrowed down by size. A size above PREFIX_SIZE shared by
+    exactly two files is settled by comparing them directly; other groups
+    are narrowed by a prefix hash, and only files that still collide on
+    both get a full _content_hash(). Files left without a key are known to
+    be unique. Digests found in the cache are used instead of reading the
+    file again, and hard links to an inode already seen are matched without
+    reading them at all.
+    
+    Args:
+        entries (list): Entry tuples from _collect(); entries of possible
+            duplicates that lack a device and inode number are updated
+            in place with ones from os.stat()
+        jobs (int): Maximum number of files hashed at once
+        cache (dict): Optional mapping of cache key to hex digest
+        
+    Returns:
+        tuple: (keys, errors), both keyed by index into entries. keys maps
+        to the file's content hash, to its (st_dev, st_ino) when it is
+        only known to be hard linked to another path, or to a ("pair", i)
+        tuple shared by two files found identical by comparison; errors
+        maps each unreadable file to the exception raised
+    """
+    keys = {}
+    errors = {}
+    cache = cache or {}
+    hits = {}
+
+    # Only files that share a size with another file can be duplicates,
+    # so the rest are never read. Buckets hold indices into entries.
+    size_map = defaultdict(list)
+    for i, entry in enumerate(entries):
+        size_map[entry[2]].append(i)
+
+    candidates = []
+    pairs = []
+    links = {}
+    for size, group in size_map.items():
+        if len(group) < 2:
+            continue
+
+        # Empty files are all identical, without opening any of them
+        if size == 0:
+            for i in group:
+                keys[i] = _EMPTY_SHA256
+            continue
+
+        # DirEntry.stat() reports st_dev and st_ino as 0 on Windows; look
+        # them up only for files that may be duplicates, so that caching,
+        # hard link detection and inode ordering work there too
+        for i in group:
+            path, name, _, _, ino, mtime_ns, ctime_ns = entries[i]
+            if not ino:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries[i] = (path, name, size, st.st_dev, st.st_ino, mtime_ns, ctime_ns)
+
+        if cache:
+            for i in group:
+                digest = cache.get(_cache_key(*entries[i][2:]))
+                if digest is not None:
+                    hits[i] = digest
+            if all(i in hits for i in group):
+                for i in group:
+                    keys[i] = hits[i]
+                continue
+
+        # Hard links to one inode are the same file: read only one of them
+        reps = {}
+        for i in group:
+            _, _, _, dev, ino, _, _ = entries[i]
+            if ino and (dev, ino) in reps:
+                links[i] = reps[(dev, ino)]
+            else:
+                reps[(dev, ino) if ino else i] = i
+        # The prefix hash already reads small files whole, more cheaply than
+        # comparing them, and its result can be cached
+        if len(reps) == 2 and size > PREFIX_SIZE:
+            pairs.append(tuple(reps.values()))
+        elif len(reps) > 1:
+            candidates.extend(i for i in group if i not in links)
+
+    # Comparing two files reads each once and stops at the first difference,
+    # but n files would need n*(n-1)/2 comparisons, so only pairs use it.
+    # Pairs that could not be compared go through hashing, which reports
+    # an error against the file that caused it.
+    pairs.sort(key=lambda pair: (entries[pair[0]][3], entries[pair[0]][4]))
+    compared = _hash_paths(
+        lambda pair: _same_content(entries[pair[0]][0], entries[pair[1]][0], entries[pair[0]][2]),
+        pairs, jobs)
+    for pair, same, error in compared:
+        if error is not None:
+            candidates.extend(pair)
+        elif same:
+            for i in pair:
+                keys[i] = ("pair", pair[0])
+
+    # Read candidates in (device, inode) order, which roughly follows their
+    # layout on disk and avoids seeking back and forth on spinning drives.
+    candidates.sort(key=lambda i: (entries[i][3], entries[i][4]))
+
+    prefixes = defaultdict(list)
+    hashed = _hash_paths(prefix_hash, [entries[i][0] for i in candidates], jobs)
+    for i, (_, prefix, error) in zip(candidates, hashed):
+        if error is not None:
+            errors[i] = error
+        else:
+            prefixes[(entries[i][2], prefix)].append(i)
+
+    full = []
+    for (size, prefix), group in prefixes.items():
+        if len(group) < 2:
+            continue
+        # The prefix already covers small files completely
+        if size <= PREFIX_SIZE:
+            for i in group:
+                keys[i] = prefix
+            continue
+        for i in group:
+            if i in hits:
+                keys[i] = hits[i]
+            else:
+                # Keep each group together so that with several jobs its
+                # members are hashed side by side on different threads
+                full.append(i)
+
+    hashed = _hash_paths(_content_hash, [entries[i][0] for i in full], jobs)
+    for i, (_, digest, error) in zip(full, hashed):
+        if error is not None:
+            errors[i] = error
+        else:
+            keys[i] = digest
+
+    # Links share their file's key. A file found to be unique by content
+    # is keyed by its inode instead, so its links still match it.
+    for i, rep in links.items():
+        if rep in errors:
+            errors[i] = errors[rep]
+            continue
+        if rep not in keys:
+            keys[rep] = entries[rep][3:5]
+        keys[i] = keys[rep]
+
+    return keys, errors
+
+
+def _extension(name):
+    """
+    Get the extension of a file name, as os.path.splitext() would.
+    
+    Leading dots mark hidden files rather than an extension, so
+    '.gitignore' has none while '.hidden.txt' has '.txt'.
+    
+    Args:
+        name (str): File name without directory
+        
+    Returns:
+        str: Extension including the dot, or '' if there is none
+    """
+    # One C-level rpartition() beats both Path.suffix and an rfind() plus
+    # slicing, which needs extra branches to handle leading dots
+    head, dot, tail = name.rpartition(".")
+    if not head.lstrip("."):
+        return ""
+    return dot + tail
+
+
+@lru_cache(maxsize=256)
 def category(ext):
     """
     Categorize a file based on its extension.
     
+    Results are memoized: a folder holds only a handful of distinct
+    extensions, so most calls skip the lower() and lookup entirely.
+    
     Args:
         ext (str): File extension (e.g., '.pdf', '.mp3')
         
     Returns:
         str: Category name (Audio, Video, Images, etc.) or 'Others' if unknown
     """
-    ext = ext.lower()  # Convert to lowercase for case-insensitive matching
-    for k, v in FILE_TYPES.items():
-        if ext in v:
-            return k
-    return "Others"
+    # Convert to lowercase for case-insensitive matching
+    return EXT_TO_CAT.get(ext.lower(), "Others")
+
+
+@lru_cache(maxsize=256)
+def _counter_pattern(base, ext):
+    """
+    Build the regex matching 'base(N)ext' conflict names.
+    
+    Memoized, since every conflict on one name needs the same pattern.
+    
+    Args:
+        base (str): File name without extension
+        ext (str): File extension, including the dot
+        
+    Returns:
+        re.Pattern: Pattern whose first group is the counter N
+    """
+    return re.compile(re.escape(base) + r"\((\d+)\)" + re.escape(ext))
 
 
-def safe_move(src, dest):
+def _next_counter(dest, base, ext):
+    """
+    Find the first unused conflict counter for a file name.
+    
+    Args:
+        dest (str): Destination directory
+        base (str): File name without extension
+        ext (str): File extension, including the dot
+        
+    Returns:
+        int: One more than the highest N among existing 'base(N)ext' files
+    """
+    pattern = _counter_pattern(base, ext)
+    highest = 0
+    try:
+        with os.scandir(dest) as it:
+            for entry in it:
+                m = pattern.fullmatch(entry.name)
+                if m:
+                    highest = max(highest, int(m.group(1)))
+    except OSError:
+        pass
+    return highest + 1
+
+
+def _make_dir(path):
+    """
+    Create a directory and any missing parents.
+    
+    Args:
+        path (str): Directory to create; it may already exist
+        
+    Raises:
+        PermissionError: If the directory cannot be created
+        OSError: If there's an error creating the directory
+    """
+    try:
+        os.makedirs(path, exist_ok=True)
+    except PermissionError:
+        raise PermissionError(f"Cannot create directory: {path} (permission denied)")
+    except OSError as e:
+        raise OSError(f"Error creating directory {path}: {str(e)}")
+
+
+def _fast_copy(src, dst):
+    """
+    Copy a file's contents, inside the kernel where possible.
+    
+    On Linux, os.copy_file_range() moves the data without passing it
+    through Python, and lets filesystems that support it clone or copy
+    server-side. Elsewhere, or when the kernel refuses, shutil.copyfile()
+    is used; it picks the platform's own fast path.
+    
+    Args:
+        src (str): File to copy
+        dst (str): Destination file, created or truncated
+        
+    Raises:
+        OSError: If the file cannot be copied
+    """
+    if _HAS_COPY_FILE_RANGE:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    shutil.copyfile(src, dst)
+
+
+def safe_move(src, dest, create=True):
     """
     Move a file to destination, handling naming conflicts.
     
     Args:
         src (str): Source file path
         dest (str): Destination directory path
+        create (bool): If False, dest is assumed to exist already, saving
+            a makedirs() call per file when moving many files into it
         
     Returns:
         str: New path of the moved file
@@ -72,40 +786,175 @@ def safe_move(src, dest):
     if not os.path.exists(src):
         raise FileNotFoundError(f"Source file not found: {src}")
     
-    try:
-        os.makedirs(dest, exist_ok=True)
-    except PermissionError:
-        raise PermissionError(f"Cannot create directory: {dest} (permission denied)")
-    except OSError as e:
-        raise OSError(f"Error creating directory {dest}: {str(e)}")
+    if create:
+        _make_dir(dest)
     
     base, ext = os.path.splitext(os.path.basename(src))
     new = os.path.join(dest, base + ext)
 
-    i = 1
-    while os.path.exists(new):
-        new = os.path.join(dest, f"{base}({i}){ext}")
-        i += 1
-
+    # Reserve a free name with an exclusive create, so the kernel settles
+    # conflicts even if something else writes to dest at the same time
     try:
-        shutil.move(src, new)
-        return new
+        i = None
+        while True:
+            try:
+                os.close(os.open(new, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+                break
+            except FileExistsError:
+                if i is None:
+                    # One directory read instead of probing file(1), file(2), ...
+                    i = _next_counter(dest, base, ext)
+                new = os.path.join(dest, f"{base}({i}){ext}")
+                i += 1
     except PermissionError:
-        raise PermissionError(f"Cannot move file {src} to {dest} (permission denied)")
+        raise PermissionError(f"Cannot create file in {dest} (permission denied)")
     except OSError as e:
+        raise OSError(f"Error creating file {new}: {str(e)}")
+
+    try:
+        try:
+            # Same filesystem: a single rename over the placeholder, no copy
+            os.replace(src, new)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            if os.path.islink(src):
+                # Recreate the link rather than copying its target. The
+                # reserved placeholder must go first, or symlink() fails
+                os.remove(new)
+                os.symlink(os.readlink(src), new)
+                os.unlink(src)
+            else:
+                # What shutil.move() does, minus its checks and copy2() wrapper
+                _fast_copy(src, new)
+                shutil.copystat(src, new)
+                os.unlink(src)
+        return new
+    except BaseException as e:
+        # Don't leave the reserved placeholder or a partial copy behind,
+        # even when interrupted (Ctrl+C during a long cross-device copy)
+        try:
+            os.remove(new)
+        except OSError:
+            pass
+        if not isinstance(e, OSError):
+            raise
+        if isinstance(e, PermissionError):
+            raise PermissionError(f"Cannot move file {src} to {dest} (permission denied)")
         raise OSError(f"Error moving file from {src} to {new}: {str(e)}")
 
 
-def organize(folder, dry_run=False):
+class _Output:
+    """
+    Buffered console output for organize().
+    
+    Per-file messages are collected and written in batches rather than with
+    one print() call each, which is slow on consoles that encode every write
+    (notably Windows). In quiet mode progress lines are dropped entirely;
+    warnings are always shown.
+    """
+
+    def __init__(self, quiet=False, batch=1000):
+        """
+        Args:
+            quiet (bool): If True, drop progress lines
+            batch (int): Number of lines buffered before writing
+        """
+        self.quiet = quiet
+        self.batch = batch
+        self._lines = []
+
+    def progress(self, line):
+        """Queue a per-file progress line."""
+        if not self.quiet:
+            self._add(line)
+
+    def warn(self, line):
+        """Queue a warning line, shown even in quiet mode."""
+        self._add(line)
+
+    def _add(self, line):
+        self._lines.append(line)
+        if len(self._lines) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        """Write all queued lines to stdout."""
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines = []
+
+
+class _MoveLog:
+    """
+    Move log written to disk as moves happen.
+    
+    Records are streamed into the JSON file instead of being collected in
+    memory and dumped at the end. The file is only created on the first
+    recorded move, so a run that moves nothing keeps the previous log.
+    """
+
+    def __init__(self, path, out):
+        """
+        Args:
+            path (str): Path of the log file
+            out (_Output): Where to report write errors
+        """
+        self.path = path
+        self.out = out
+        self._file = None
+        self._failed = False
+
+    def record(self, src, dest):
+        """
+        Append a move to the log.
+        
+        Args:
+            src (str): Original path of the file
+            dest (str): Path the file was moved to
+        """
+        if self._failed:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, "w")
+                timestamp = json.dumps(datetime.now().isoformat())
+                self._file.write(f'{{\n  "timestamp": {timestamp},\n  "moves": [\n')
+            else:
+                self._file.write(",\n")
+            self._file.write("    " + json.dumps({"from": src, "to": dest}))
+        except (IOError, OSError) as e:
+            self.out.warn(f"⚠ Warning: Could not write log file: {str(e)}")
+            self._failed = True
+
+    def close(self):
+        """Terminate the JSON document and close the file."""
+        if self._file is None:
+            return
+        try:
+            if not self._failed:
+                self._file.write("\n  ]\n}\n")
+            self._file.close()
+        except (IOError, OSError) as e:
+            self.out.warn(f"⚠ Warning: Could not write log file: {str(e)}")
+        self._file = None
+
+
+def organize(folder, dry_run=False, jobs=1, quiet=False):
     """
     Organize files in a folder by categorizing them into subdirectories.
     
     Args:
         folder (str): Path to the folder to organize
         dry_run (bool): If True, preview changes without making them
+        jobs (int): Number of files to hash in parallel, or 0 to pick a
+            count from the number of CPUs. Values above 1 help on SSDs;
+            spinning disks are usually fastest with 1
+        quiet (bool): If True, only print warnings, not each moved file
         
     Raises:
-        ValueError: If folder doesn't exist
+        ValueError: If folder doesn't exist or jobs is negative
         PermissionError: If folder cannot be accessed
         OSError: If there's an error during organization
     """
@@ -118,61 +967,80 @@ def organize(folder, dry_run=False):
     if not os.access(folder, os.R_OK):
         raise PermissionError(f"Cannot read folder: {folder} (permission denied)")
     
-    seen = {}
-    log = []
+    if jobs < 0:
+        raise ValueError(f"jobs must be 0 (auto) or a positive number, got {jobs}")
+    if jobs == 0:
+        jobs = _auto_jobs()
+    
+    seen = set()
+    out = _Output(quiet)
+    log = _MoveLog(os.path.join(folder, LOG_FILE), out)
     skipped = 0
 
-    for root, _, files in os.walk(folder):
-        for f in files:
-            if f == LOG_FILE:
-                continue
+    try:
+        entries, failed = _collect(folder, out)
+        skipped += failed
 
-            src = os.path.join(root, f)
-            _, ext = os.path.splitext(f)
-            ext = ext.lower()
+        cache_path = os.path.join(folder, CACHE_FILE)
+        keys, errors = _dedupe_keys(entries, jobs, _load_cache(cache_path))
 
-            cat = category(ext)
-            dest_dir = os.path.join(folder, cat)
+        dest_dirs = {cat: os.path.join(folder, cat) for cat in list(FILE_TYPES) + ["Others"]}
+        # Category directories are created once, on their first move, so no
+        # empty ones are left behind and safe_move() need not check each time
+        made = set()
+        moved = {}
 
-            # Try to hash the file, skip if there's an error
-            try:
-                h = sha256(src)
-            except (FileNotFoundError, PermissionError, IOError) as e:
-                print(f"⚠ Skipped {src}: {str(e)}")
+        for i, (src, f, _, _, _, _, _) in enumerate(entries):
+            cat = category(_extension(f))
+            dest_dir = dest_dirs[cat]
+
+            # Skip files that could not be read while checking for duplicates
+            if i in errors:
+                out.warn(f"⚠ Skipped {src}: {str(errors[i])}")
                 skipped += 1
                 continue
 
-            if h in seen:
-                print(f"🗑 duplicate → {src}")
-                if not dry_run:
-                    try:
-                        os.remove(src)
-                    except (PermissionError, OSError) as e:
-                        print(f"⚠ Could not delete duplicate {src}: {str(e)}")
-                continue
-            seen[h] = src
+            h = keys.get(i)
+            if h is not None:
+                if h in seen:
+                    out.progress(f"🗑 duplicate → {src}")
+                    if not dry_run:
+                        try:
+                            os.remove(src)
+                            moved[i] = None
+                        except (PermissionError, OSError) as e:
+                            out.warn(f"⚠ Could not delete duplicate {src}: {str(e)}")
+                    continue
+                seen.add(h)
 
             if os.path.dirname(src) == dest_dir:
                 continue
 
-            print(f"📁 {src} → {cat}")
+            out.progress(f"📁 {src} → {cat}")
 
             if not dry_run:
                 try:
-                    new_path = safe_move(src, dest_dir)
-                    log.append({"from": src, "to": new_path})
+                    if cat not in made:
+                        _make_dir(dest_dir)
+                        made.add(cat)
+                    new_path = safe_move(src, dest_dir, create=False)
+                    moved[i] = new_path
+                    log.record(src, new_path)
                 except (FileNotFoundError, PermissionError, OSError) as e:
-                    print(f"⚠ Could not move {src}: {str(e)}")
+                    out.warn(f"⚠ Could not move {src}: {str(e)}")
                     skipped += 1
                     continue
 
-    if not dry_run and log:
-        try:
-            with open(os.path.join(folder, LOG_FILE), "w") as f:
-                json.dump({"timestamp": datetime.now().isoformat(), "moves": log}, f, indent=2)
-        except (IOError, OSError) as e:
-            print(f"⚠ Warning: Could not write log file: {str(e)}")
-    
-    if skipped > 0:
-        print(f"\n⚠ {skipped} file(s) were skipped due to errors")
+        if not dry_run:
+            digests = _current_digests(entries, keys, moved)
+            if digests:
+                _save_cache(cache_path, digests, out)
 
+        if skipped > 0:
+            out.warn(f"\n⚠ {skipped} file(s) were skipped due to errors")
+    finally:
+        # Even if the run is interrupted, queued warnings are printed and the
+        # moves made so far are logged as a complete JSON document that
+        # restore can read
+        log.close()
+        out.flush()
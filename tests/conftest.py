@@ -0,0 +1,62 @@
+"""
+Shared fixtures for the Organize CLI test suite
+"""
+
+import os
+import shutil
+import tempfile
+import pytest
+from pathlib import Path
+
+
+# Memory-backed scratch space for shm_path, unless TMPDIR picks a location
+_SHM = "/dev/shm"
+
+
+# One file per common category, each with distinct content so none is a
+# duplicate of another
+SEED_FILES = {
+    "song.mp3": "audio",
+    "image.jpg": "image",
+    "document.pdf": "doc",
+    "script.py": "code",
+    "archive.zip": "archive",
+    "readme.md": "readme",
+}
+
+
+@pytest.fixture
+def shm_path(request):
+    """
+    Per-test scratch directory on tmpfs, when the system has one.
+    
+    Falls back to pytest's tmp_path when --basetemp or TMPDIR chooses the
+    location, or without /dev/shm (macOS, Windows). The directory is left
+    in place when the test fails, to help debugging.
+    """
+    if (request.config.option.basetemp or os.environ.get("TMPDIR")
+            or not os.path.isdir(_SHM)):
+        yield request.getfixturevalue("tmp_path")
+        return
+    failed = request.session.testsfailed
+    path = Path(tempfile.mkdtemp(prefix="organize-test-", dir=_SHM))
+    yield path
+    if request.session.testsfailed == failed:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def seed_dir(tmp_path_factory):
+    """Unorganized folder built once per session; copy it, don't modify it"""
+    seed = tmp_path_factory.mktemp("seed")
+    for name, content in SEED_FILES.items():
+        (seed / name).write_text(content)
+    return seed
+
+
+@pytest.fixture
+def workdir(tmp_path, seed_dir):
+    """Fresh copy of seed_dir for a test to organize"""
+    work = tmp_path / "work"
+    shutil.copytree(seed_dir, work)
+    return work
@@ -30,7 +30,7 @@ class TestCLIArguments:
         """Specific folder path should be passed to organize"""
         with patch("sys.argv", ["organize", "/path/to/folder"]):
             main()
-            mock_organize.assert_called_once_with("/path/to/folder", dry_run=False)
+            mock_organize.assert_called_once_with("/path/to/folder", dry_run=False, jobs=1, quiet=False)
 
     @patch("organize.cli.organize")
     def test_cli_dry_run_flag(self, mock_organize):
@@ -54,7 +54,21 @@ class TestCLIArguments:
         """Folder path and --dry-run should work together"""
         with patch("sys.argv", ["organize", "/tmp", "--dry-run"]):
             main()
-            mock_organize.assert_called_once_with("/tmp", dry_run=True)
+            mock_organize.assert_called_once_with("/tmp", dry_run=True, jobs=1, quiet=False)
+
+    @patch("organize.cli.organize")
+    def test_cli_jobs_flag(self, mock_organize):
+        """--jobs should be passed to organize as an integer"""
+        with patch("sys.argv", ["organize", "/tmp", "--jobs", "4"]):
+            main()
+            mock_organize.assert_called_once_with("/tmp", dry_run=False, jobs=4, quiet=False)
+
+    @patch("organize.cli.organize")
+    def test_cli_quiet_flag(self, mock_organize):
+        """--quiet should be passed to organize"""
+        with patch("sys.argv", ["organize", "/tmp", "-q"]):
+            main()
+            assert mock_organize.call_args[1]["quiet"] is True
 
 
 class TestCLIIntegration:
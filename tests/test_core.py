@@ -5,12 +5,20 @@ Tests cover: sha256 hashing, categorization, safe moving, and organization
 
 import os
 import json
+import errno
+import hashlib
 import pytest
 import tempfile
 import shutil
+import time
 from pathlib import Path
+from unittest.mock import patch
 
-from organize.core import sha256, category, safe_move, organize, LOG_FILE
+from organize.core import (
+    sha256, prefix_hash, category, safe_move, organize,
+    CACHE_FILE, CHUNK_SIZE, EXT_TO_CAT, HASH_ALGORITHM, LOG_FILE, PREFIX_SIZE,
+    _collect, _content_hash, _fast_copy, _same_content, _sha256_file,
+)
 from organize.filetypes import FILE_TYPES
 
 
@@ -49,9 +57,10 @@ class TestSha256:
             file2.write_text("")
             
             assert sha256(str(file1)) == sha256(str(file2))
+            assert sha256(str(file1)) == hashlib.sha256(b"").hexdigest()
 
     def test_sha256_large_file(self):
-        """Large files should be hashed correctly (chunks of 8192 bytes)"""
+        """Large files should be hashed correctly (chunks of 1 MiB)"""
         with tempfile.TemporaryDirectory() as tmpdir:
             file1 = Path(tmpdir) / "large1.bin"
             file2 = Path(tmpdir) / "large2.bin"
@@ -63,6 +72,79 @@ class TestSha256:
             
             assert sha256(str(file1)) == sha256(str(file2))
 
+    def test_sha256_matches_hashlib_across_chunks(self):
+        """Files spanning several read chunks should match a one-shot digest"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "multi.bin"
+            
+            data = bytes(range(256)) * (3 * 4096) + b"tail"
+            file1.write_bytes(data)
+            
+            assert sha256(str(file1)) == hashlib.sha256(data).hexdigest()
+
+    def test_sha256_chunked_fallback(self):
+        """The chunked read loop should match hashlib.file_digest"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "multi.bin"
+            
+            data = bytes(range(256)) * (3 * 4096) + b"tail"
+            file1.write_bytes(data)
+            
+            with patch("organize.core._HAS_FILE_DIGEST", False):
+                assert sha256(str(file1)) == hashlib.sha256(data).hexdigest()
+
+    def test_sha256_chunked_fallback_small_file(self):
+        """A file smaller than one chunk should hash correctly in the fallback"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "small.bin"
+            
+            data = b"x" * 5000
+            file1.write_bytes(data)
+            
+            with patch("organize.core._HAS_FILE_DIGEST", False):
+                assert sha256(str(file1)) == hashlib.sha256(data).hexdigest()
+
+    def test_sha256_reads_file_reporting_zero_size(self):
+        """A reported size of 0 should not be trusted to mean an empty file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "proc.txt"
+            
+            data = b"not empty"
+            file1.write_bytes(data)
+            
+            for has_file_digest in {hasattr(hashlib, "file_digest"), False}:
+                with patch("organize.core._HAS_FILE_DIGEST", has_file_digest):
+                    with open(file1, "rb") as f:
+                        assert _sha256_file(f, 0) == hashlib.sha256(data).hexdigest()
+
+    def test_sha256_memory_mapped(self):
+        """Files above the mmap threshold should hash the same as streamed ones"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "mapped.bin"
+            
+            data = bytes(range(256)) * 4096
+            file1.write_bytes(data)
+            
+            with patch("organize.core.MMAP_THRESHOLD", 1):
+                assert sha256(str(file1)) == hashlib.sha256(data).hexdigest()
+
+    def test_sha256_missing_file(self):
+        """Missing files should raise FileNotFoundError"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(FileNotFoundError):
+                sha256(str(Path(tmpdir) / "missing.txt"))
+
+    def test_sha256_without_fadvise(self):
+        """Hashing should work on platforms without posix_fadvise"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "plain.bin"
+            
+            data = b"x" * (CHUNK_SIZE + 1)
+            file1.write_bytes(data)
+            
+            with patch("organize.core._HAS_FADVISE", False):
+                assert sha256(str(file1)) == hashlib.sha256(data).hexdigest()
+
     def test_sha256_binary_files(self):
         """Binary files should be hashed correctly"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -76,6 +158,157 @@ class TestSha256:
             assert sha256(str(file1)) == sha256(str(file2))
 
 
+class TestContentHash:
+    """Tests for the whole-file hash used for duplicate detection"""
+
+    def test_content_hash_identical_files(self):
+        """Identical files should have identical content hashes"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "file1.bin"
+            file2 = Path(tmpdir) / "file2.bin"
+            
+            file1.write_bytes(b"y" * 10000)
+            file2.write_bytes(b"y" * 10000)
+            
+            assert _content_hash(str(file1)) == _content_hash(str(file2))
+
+    def test_content_hash_falls_back_to_sha256(self):
+        """Without blake3 the content hash should be SHA-256"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "file1.txt"
+            file1.write_text("content")
+            
+            with patch("organize.core.blake3", None):
+                assert _content_hash(str(file1)) == sha256(str(file1))
+
+    def test_content_hash_missing_file(self):
+        """Missing files should raise FileNotFoundError"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(FileNotFoundError):
+                _content_hash(str(Path(tmpdir) / "missing.txt"))
+
+
+class TestPrefixHash:
+    """Tests for the prefix hash used to pre-filter duplicate candidates"""
+
+    def test_prefix_hash_small_file_matches_full_hash(self):
+        """Files smaller than the prefix should hash the same as sha256"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "small.txt"
+            file1.write_text("small content")
+            
+            assert prefix_hash(str(file1)) == sha256(str(file1))
+
+    def test_prefix_hash_missing_file(self):
+        """Missing files should raise FileNotFoundError"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(FileNotFoundError):
+                prefix_hash(str(Path(tmpdir) / "missing.txt"))
+
+    def test_prefix_hash_ignores_bytes_after_prefix(self):
+        """Files differing only after the prefix should share a prefix hash"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "file1.bin"
+            file2 = Path(tmpdir) / "file2.bin"
+            
+            file1.write_bytes(b"x" * PREFIX_SIZE + b"a")
+            file2.write_bytes(b"x" * PREFIX_SIZE + b"b")
+            
+            assert prefix_hash(str(file1)) == prefix_hash(str(file2))
+            assert sha256(str(file1)) != sha256(str(file2))
+
+
+class TestSameContent:
+    """Tests for the byte-by-byte comparison of duplicate pairs"""
+
+    def test_same_content_identical(self):
+        """Identical files spanning several chunks should compare equal"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data = os.urandom(CHUNK_SIZE * 2 + 123)
+            (Path(tmpdir) / "a.bin").write_bytes(data)
+            (Path(tmpdir) / "b.bin").write_bytes(data)
+            
+            assert _same_content(str(Path(tmpdir) / "a.bin"), str(Path(tmpdir) / "b.bin"))
+
+    def test_same_content_differs_after_first_chunk(self):
+        """A difference past the first chunk should be found"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "a.bin").write_bytes(b"x" * CHUNK_SIZE + b"a")
+            (Path(tmpdir) / "b.bin").write_bytes(b"x" * CHUNK_SIZE + b"b")
+            
+            assert not _same_content(str(Path(tmpdir) / "a.bin"), str(Path(tmpdir) / "b.bin"))
+
+    def test_same_content_sized_buffers(self):
+        """Buffers sized to the file should still see every byte"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a = Path(tmpdir) / "a.bin"
+            b = Path(tmpdir) / "b.bin"
+            a.write_bytes(b"x" * (PREFIX_SIZE + 1))
+            b.write_bytes(b"x" * PREFIX_SIZE + b"y")
+            size = PREFIX_SIZE + 1
+            
+            assert _same_content(str(a), str(a), size)
+            assert not _same_content(str(a), str(b), size)
+            # A file that grew since it was scanned is still read to the end
+            assert not _same_content(str(a), str(b), PREFIX_SIZE)
+
+    def test_same_content_empty_files(self):
+        """Two empty files should compare equal"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "a.txt").write_bytes(b"")
+            (Path(tmpdir) / "b.txt").write_bytes(b"")
+            
+            assert _same_content(str(Path(tmpdir) / "a.txt"), str(Path(tmpdir) / "b.txt"))
+
+    def test_same_content_missing_file(self):
+        """The missing file should be named in the error"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "a.txt").write_text("content")
+            missing = str(Path(tmpdir) / "missing.txt")
+            
+            with pytest.raises(FileNotFoundError, match="missing.txt"):
+                _same_content(str(Path(tmpdir) / "a.txt"), missing)
+
+
+class TestFastCopy:
+    """Tests for the in-kernel copy used by cross-device moves"""
+
+    def test_fast_copy_copies_contents(self):
+        """The copy should match the source byte for byte"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "src.bin"
+            dst = Path(tmpdir) / "dst.bin"
+            data = os.urandom(CHUNK_SIZE * 2 + 7)
+            src.write_bytes(data)
+            dst.write_bytes(b"placeholder")
+            
+            _fast_copy(str(src), str(dst))
+            
+            assert dst.read_bytes() == data
+
+    def test_fast_copy_falls_back_when_unsupported(self):
+        """An unsupported in-kernel copy should fall back to shutil.copyfile"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "src.bin"
+            dst = Path(tmpdir) / "dst.bin"
+            src.write_bytes(b"content")
+            
+            exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+            with patch("organize.core._HAS_COPY_FILE_RANGE", True), \
+                    patch("organize.core.os.copy_file_range", side_effect=exdev, create=True), \
+                    patch("organize.core.shutil.copyfile", wraps=shutil.copyfile) as mock_copy:
+                _fast_copy(str(src), str(dst))
+                mock_copy.assert_called_once()
+            
+            assert dst.read_bytes() == b"content"
+
+    def test_fast_copy_missing_source(self):
+        """A missing source should raise, not fall back"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(FileNotFoundError):
+                _fast_copy(str(Path(tmpdir) / "missing"), str(Path(tmpdir) / "dst"))
+
+
 class TestCategory:
     """Tests for file categorization logic"""
 
@@ -135,6 +368,13 @@ class TestCategory:
         """Files with no extension should be Others"""
         assert category("") == "Others"
 
+    def test_category_is_cached(self):
+        """Repeated extensions should be served from the cache"""
+        category.cache_clear()
+        assert category(".jpg") == "Images"
+        assert category(".jpg") == "Images"
+        assert category.cache_info().hits == 1
+
 
 class TestSafeMove:
     """Tests for safe file moving with conflict resolution"""
@@ -166,6 +406,20 @@ class TestSafeMove:
             assert dest_dir.exists()
             assert Path(result).exists()
 
+    def test_safe_move_without_create_needs_destination(self):
+        """With create=False a missing destination should not be created"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "source.txt"
+            dest_dir = Path(tmpdir) / "missing"
+            
+            src.write_text("content")
+            
+            with pytest.raises(OSError):
+                safe_move(str(src), str(dest_dir), create=False)
+            
+            assert not dest_dir.exists()
+            assert src.exists()
+
     def test_safe_move_conflict_resolution(self):
         """When destination file exists, should rename with counter"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -201,6 +455,126 @@ class TestSafeMove:
             assert Path(result).name == "file(3).txt"
             assert Path(result).exists()
 
+    def test_safe_move_skips_past_highest_counter(self):
+        """The counter should continue after the highest existing one"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "file.txt"
+            dest_dir = Path(tmpdir) / "dest"
+            
+            src.write_text("new")
+            dest_dir.mkdir()
+            (dest_dir / "file.txt").write_text("existing")
+            (dest_dir / "file(4).txt").write_text("existing4")
+            (dest_dir / "file(12).pdf").write_text("other extension")
+            (dest_dir / "other(20).txt").write_text("other stem")
+            
+            result = safe_move(str(src), str(dest_dir))
+            
+            assert Path(result).name == "file(5).txt"
+
+    def test_safe_move_same_filesystem_renames(self):
+        """A move within one filesystem should rename, not copy, the file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "file.txt"
+            dest_dir = Path(tmpdir) / "dest"
+            
+            src.write_text("content")
+            inode = src.stat().st_ino
+            
+            with patch("organize.core.shutil.move") as mock_move:
+                result = safe_move(str(src), str(dest_dir))
+                mock_move.assert_not_called()
+            
+            assert not src.exists()
+            assert os.stat(result).st_ino == inode
+
+    def test_safe_move_across_filesystems(self):
+        """A cross-device rename should fall back to copying the file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "file.txt"
+            dest_dir = Path(tmpdir) / "dest"
+            
+            src.write_text("content")
+            
+            exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+            with patch("organize.core.os.replace", side_effect=exdev):
+                result = safe_move(str(src), str(dest_dir))
+            
+            assert not src.exists()
+            assert Path(result).read_text() == "content"
+
+    def test_safe_move_across_filesystems_keeps_metadata(self):
+        """A cross-device move should keep the file's modification time"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "file.txt"
+            dest_dir = Path(tmpdir) / "dest"
+            
+            src.write_text("content")
+            os.utime(src, (1_000_000_000, 1_000_000_000))
+            
+            exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+            with patch("organize.core.os.replace", side_effect=exdev):
+                result = safe_move(str(src), str(dest_dir))
+            
+            assert os.stat(result).st_mtime == 1_000_000_000
+
+    def test_safe_move_across_filesystems_keeps_symlink(self):
+        """A symlink moved across devices should stay a symlink"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "target.txt"
+            src = Path(tmpdir) / "link.txt"
+            dest_dir = Path(tmpdir) / "dest"
+            
+            target.write_text("content")
+            try:
+                os.symlink(target, src)
+            except (OSError, NotImplementedError):
+                pytest.skip("symlinks not supported on this platform")
+            
+            # A real cross-device move makes every rename fail, not only
+            # the one safe_move() tries first
+            exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+            with patch("organize.core.os.replace", side_effect=exdev), \
+                    patch("os.rename", side_effect=exdev):
+                result = safe_move(str(src), str(dest_dir))
+            
+            assert os.path.islink(result)
+            assert os.readlink(result) == str(target)
+            assert not os.path.lexists(src)
+            assert target.exists()
+
+    def test_safe_move_failure_removes_placeholder(self):
+        """A failed move should not leave the reserved name behind"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "file.txt"
+            dest_dir = Path(tmpdir) / "dest"
+            
+            src.write_text("content")
+            
+            with patch("organize.core.os.replace", side_effect=PermissionError()):
+                with pytest.raises(PermissionError):
+                    safe_move(str(src), str(dest_dir))
+            
+            assert src.exists()
+            assert not (dest_dir / "file.txt").exists()
+
+    def test_safe_move_interrupted_copy_removes_placeholder(self):
+        """An interrupt during a cross-device copy should not leave the reserved name behind"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "file.txt"
+            dest_dir = Path(tmpdir) / "dest"
+            
+            src.write_text("content")
+            
+            exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+            with patch("organize.core.os.replace", side_effect=exdev), \
+                    patch("organize.core._fast_copy", side_effect=KeyboardInterrupt):
+                with pytest.raises(KeyboardInterrupt):
+                    safe_move(str(src), str(dest_dir))
+            
+            assert src.exists()
+            assert not (dest_dir / "file.txt").exists()
+
     def test_safe_move_preserves_extension(self):
         """File extension should be preserved with counter"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -220,54 +594,240 @@ class TestSafeMove:
 class TestOrganize:
     """Tests for the main organize function"""
 
-    def test_organize_basic_files(self):
+    def test_organize_basic_files(self, workdir):
         """Basic file organization should work"""
+        organize(str(workdir), dry_run=False)
+        
+        assert not (workdir / "song.mp3").exists()
+        assert not (workdir / "image.jpg").exists()
+        assert not (workdir / "document.pdf").exists()
+        
+        assert (workdir / "Audio" / "song.mp3").exists()
+        assert (workdir / "Images" / "image.jpg").exists()
+        assert (workdir / "Documents" / "document.pdf").exists()
+
+    def test_organize_dry_run(self, workdir):
+        """Dry run should preview without making changes"""
+        before = sorted(p.name for p in workdir.iterdir())
+        
+        organize(str(workdir), dry_run=True)
+        
+        # Original files should still be there, and nothing created
+        assert sorted(p.name for p in workdir.iterdir()) == before
+
+    def test_organize_duplicate_detection(self):
+        """Duplicate files should be detected and removed"""
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
             
-            # Create test files
-            (tmpdir / "song.mp3").write_text("audio")
-            (tmpdir / "image.jpg").write_text("image")
-            (tmpdir / "document.pdf").write_text("doc")
+            # Create duplicate files
+            (tmpdir / "original.txt").write_text("same content")
+            (tmpdir / "duplicate.txt").write_text("same content")
             
             organize(str(tmpdir), dry_run=False)
             
-            assert not (tmpdir / "song.mp3").exists()
-            assert not (tmpdir / "image.jpg").exists()
-            assert not (tmpdir / "document.pdf").exists()
-            
-            assert (tmpdir / "Audio" / "song.mp3").exists()
-            assert (tmpdir / "Images" / "image.jpg").exists()
-            assert (tmpdir / "Documents" / "document.pdf").exists()
+            # One should be moved, one should be deleted
+            assert (tmpdir / "Documents" / "original.txt").exists()
+            assert not (tmpdir / "Documents" / "duplicate.txt").exists()
+            assert not (tmpdir / "duplicate.txt").exists()
 
-    def test_organize_dry_run(self):
-        """Dry run should preview without making changes"""
+    def test_organize_creates_each_category_once(self):
+        """Category directories should be created once, not per moved file"""
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
             
+            for i in range(5):
+                (tmpdir / f"doc{i}.txt").write_text("x" * (i + 1))
             (tmpdir / "song.mp3").write_text("audio")
             
-            organize(str(tmpdir), dry_run=True)
+            with patch("organize.core.os.makedirs", wraps=os.makedirs) as mock_makedirs:
+                organize(str(tmpdir), dry_run=False)
+                created = sorted(Path(c.args[0]).name for c in mock_makedirs.call_args_list)
             
-            # Original file should still be there
-            assert (tmpdir / "song.mp3").exists()
-            assert not (tmpdir / "Audio").exists()
+            assert created == ["Audio", "Documents"]
+            assert len(list((tmpdir / "Documents").iterdir())) == 5
 
-    def test_organize_duplicate_detection(self):
-        """Duplicate files should be detected and removed"""
+    def test_organize_skips_hashing_unique_sizes(self):
+        """Files with a unique size cannot be duplicates and are not hashed"""
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
             
-            # Create duplicate files
-            (tmpdir / "original.txt").write_text("same content")
-            (tmpdir / "duplicate.txt").write_text("same content")
+            (tmpdir / "a.txt").write_text("a")
+            (tmpdir / "bb.txt").write_text("bb")
+            (tmpdir / "sub").mkdir()
+            (tmpdir / "sub" / "ccc.mp3").write_text("ccc")
+            
+            with patch("organize.core.prefix_hash", wraps=prefix_hash) as mock_prefix, \
+                    patch("organize.core._content_hash", wraps=_content_hash) as mock_sha:
+                organize(str(tmpdir), dry_run=False)
+                mock_prefix.assert_not_called()
+                mock_sha.assert_not_called()
+            
+            assert (tmpdir / "Documents" / "a.txt").exists()
+            assert (tmpdir / "Documents" / "bb.txt").exists()
+            assert (tmpdir / "Audio" / "ccc.mp3").exists()
+
+    def test_organize_hashes_only_colliding_sizes(self):
+        """Only files sharing a size with another file should be read"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "dup1.txt").write_text("same")
+            (tmpdir / "dup2.txt").write_text("same")
+            (tmpdir / "unique.txt").write_text("a different size")
+            
+            with patch("organize.core.prefix_hash", wraps=prefix_hash) as mock_prefix, \
+                    patch("organize.core._same_content", wraps=_same_content) as mock_cmp:
+                organize(str(tmpdir), dry_run=False)
+                hashed = sorted(Path(c.args[0]).name for c in mock_prefix.call_args_list)
+                # Small files are hashed whole by the prefix, not compared
+                mock_cmp.assert_not_called()
+            
+            assert hashed == ["dup1.txt", "dup2.txt"]
+            assert (tmpdir / "Documents" / "unique.txt").exists()
+
+    def test_organize_compares_pairs_without_hashing(self):
+        """Two files of the same size should be compared, not hashed"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            data = b"x" * PREFIX_SIZE + b"same tail"
+            (tmpdir / "original.bin").write_bytes(data)
+            (tmpdir / "copy.bin").write_bytes(data)
+            
+            with patch("organize.core.prefix_hash", wraps=prefix_hash) as mock_prefix, \
+                    patch("organize.core._content_hash", wraps=_content_hash) as mock_sha:
+                organize(str(tmpdir), dry_run=False)
+                mock_prefix.assert_not_called()
+                mock_sha.assert_not_called()
+            
+            remaining = list((tmpdir / "Executables").iterdir())
+            assert len(remaining) == 1
+            assert remaining[0].read_bytes() == data
+
+    def test_organize_hashes_groups_of_three(self):
+        """Three or more files of the same size should be hashed, not compared"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            for name in ("a.txt", "b.txt", "c.txt"):
+                (tmpdir / name).write_text("same")
+            
+            with patch("organize.core._same_content", wraps=_same_content) as mock_cmp:
+                organize(str(tmpdir), dry_run=False)
+                mock_cmp.assert_not_called()
+            
+            assert len(list((tmpdir / "Documents").iterdir())) == 1
+
+    def test_organize_empty_files_not_opened(self):
+        """Empty files should be matched as duplicates without being read"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            for name in ("a.txt", "b.txt", "c.txt"):
+                (tmpdir / name).write_bytes(b"")
+            
+            with patch("organize.core.prefix_hash", wraps=prefix_hash) as mock_prefix, \
+                    patch("organize.core._same_content", wraps=_same_content) as mock_cmp:
+                organize(str(tmpdir), dry_run=False)
+                mock_prefix.assert_not_called()
+                mock_cmp.assert_not_called()
+            
+            assert len(list((tmpdir / "Documents").iterdir())) == 1
+
+    def test_organize_same_size_different_content(self):
+        """Same-sized files with different content should both be kept"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "one.txt").write_text("abc")
+            (tmpdir / "two.txt").write_text("xyz")
             
             organize(str(tmpdir), dry_run=False)
             
-            # One should be moved, one should be deleted
-            assert (tmpdir / "Documents" / "original.txt").exists()
-            assert not (tmpdir / "Documents" / "duplicate.txt").exists()
-            assert not (tmpdir / "duplicate.txt").exists()
+            assert (tmpdir / "Documents" / "one.txt").exists()
+            assert (tmpdir / "Documents" / "two.txt").exists()
+
+    def test_organize_skips_full_hash_on_prefix_mismatch(self):
+        """Same-sized large files with different prefixes are not fully hashed"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            for name in ("a.bin", "b.bin", "c.bin"):
+                (tmpdir / name).write_bytes(name[0].encode() * (PREFIX_SIZE * 2))
+            
+            with patch("organize.core._content_hash", wraps=_content_hash) as mock_sha:
+                organize(str(tmpdir), dry_run=False)
+                mock_sha.assert_not_called()
+            
+            assert len(list((tmpdir / "Executables").iterdir())) == 3
+
+    def test_organize_large_duplicate_detection(self):
+        """Large duplicates should be confirmed with a full hash"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            data = b"x" * PREFIX_SIZE + b"same tail"
+            (tmpdir / "original.bin").write_bytes(data)
+            (tmpdir / "copy.bin").write_bytes(data)
+            (tmpdir / "other.bin").write_bytes(b"x" * PREFIX_SIZE + b"diff tail")
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            remaining = sorted(p.name for p in (tmpdir / "Executables").iterdir())
+            assert len(remaining) == 2
+            assert "other.bin" in remaining
+
+    @pytest.mark.skipif(os.name == "nt", reason="DirEntry.stat() reports no inode numbers on Windows")
+    def test_organize_hashes_in_inode_order(self):
+        """Duplicate candidates should be read in inode order"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            for i in range(5):
+                (tmpdir / f"file{i}.txt").write_text(f"same size {i}")
+            
+            with patch("organize.core.prefix_hash", wraps=prefix_hash) as mock_prefix:
+                organize(str(tmpdir), dry_run=True)
+                order = [os.stat(c.args[0]).st_ino for c in mock_prefix.call_args_list]
+            
+            assert len(order) == 5
+            assert order == sorted(order)
+
+    def test_organize_parallel_hashing(self):
+        """Hashing with several jobs should find the same duplicates"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            for i in range(4):
+                (tmpdir / f"dup{i}.txt").write_text("same content")
+                (tmpdir / f"uniq{i}.txt").write_text(f"unique content {i}")
+            
+            organize(str(tmpdir), dry_run=False, jobs=4)
+            
+            remaining = [p.name for p in (tmpdir / "Documents").iterdir()]
+            assert len([n for n in remaining if n.startswith("dup")]) == 1
+            assert len([n for n in remaining if n.startswith("uniq")]) == 4
+
+    def test_organize_invalid_jobs(self):
+        """Negative jobs should be rejected"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                organize(tmpdir, jobs=-1)
+
+    def test_organize_auto_jobs(self):
+        """jobs=0 should hash with an automatically sized thread pool"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "a.txt").write_text("same")
+            (tmpdir / "b.txt").write_text("same")
+            
+            with patch("organize.core._auto_jobs", return_value=2) as mock_auto:
+                organize(str(tmpdir), dry_run=False, jobs=0)
+                mock_auto.assert_called_once()
+            
+            assert len(list((tmpdir / "Documents").iterdir())) == 1
 
     def test_organize_subdirectories(self):
         """Files in subdirectories should be organized"""
@@ -303,6 +863,73 @@ class TestOrganize:
             assert "moves" in log_data
             assert len(log_data["moves"]) == 1
 
+    def test_organize_log_records_every_move(self):
+        """The streamed log should be valid JSON listing each move in order"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "a.pdf").write_text("a")
+            (tmpdir / "bb.mp3").write_text("bb")
+            (tmpdir / "ccc.jpg").write_text("ccc")
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            log_data = json.loads((tmpdir / LOG_FILE).read_text())
+            assert len(log_data["moves"]) == 3
+            for move in log_data["moves"]:
+                assert Path(move["to"]).exists()
+                assert not Path(move["from"]).exists()
+
+    def test_organize_log_complete_after_interruption(self):
+        """An interrupted run should still leave a valid log of its moves"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "a.txt").write_text("a")
+            (tmpdir / "bb.txt").write_text("bb")
+            
+            calls = []
+            def move_then_interrupt(src, dest, create=True):
+                if calls:
+                    raise KeyboardInterrupt
+                calls.append(src)
+                return safe_move(src, dest, create)
+            
+            with patch("organize.core.safe_move", side_effect=move_then_interrupt):
+                with pytest.raises(KeyboardInterrupt):
+                    organize(str(tmpdir), dry_run=False)
+            
+            log_data = json.loads((tmpdir / LOG_FILE).read_text())
+            assert len(log_data["moves"]) == 1
+            assert log_data["moves"][0]["from"] == calls[0]
+
+    def test_organize_prints_scan_warnings_after_interruption(self, capsys):
+        """Warnings queued while scanning should be printed if hashing is interrupted"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            def collect_with_warning(folder, out):
+                out.warn("⚠ Could not read folder")
+                return [], 1
+            
+            with patch("organize.core._collect", side_effect=collect_with_warning), \
+                    patch("organize.core._dedupe_keys", side_effect=KeyboardInterrupt):
+                with pytest.raises(KeyboardInterrupt):
+                    organize(tmpdir, dry_run=False)
+            
+            assert "Could not read folder" in capsys.readouterr().out
+
+    def test_organize_keeps_log_when_nothing_moves(self):
+        """A run with no moves should leave the previous log intact"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "file.pdf").write_text("content")
+            organize(str(tmpdir), dry_run=False)
+            first = (tmpdir / LOG_FILE).read_text()
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            assert (tmpdir / LOG_FILE).read_text() == first
+
     def test_organize_already_organized(self):
         """Already organized files should be skipped"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -349,29 +976,190 @@ class TestOrganize:
             # Readable file should be organized
             assert (tmpdir / "Documents" / "readable.txt").exists()
 
-    def test_organize_mixed_file_types(self):
-        """Multiple file types should be organized into correct categories"""
+    def test_organize_quiet_suppresses_progress(self, capsys):
+        """Quiet mode should not print a line per moved file"""
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
             
             (tmpdir / "song.mp3").write_text("audio")
-            (tmpdir / "image.jpg").write_text("image")
-            (tmpdir / "script.py").write_text("code")
-            (tmpdir / "archive.zip").write_text("archive")
-            (tmpdir / "readme.md").write_text("doc")
             
-            organize(str(tmpdir), dry_run=False)
+            organize(str(tmpdir), dry_run=False, quiet=True)
             
+            assert capsys.readouterr().out == ""
             assert (tmpdir / "Audio" / "song.mp3").exists()
-            assert (tmpdir / "Images" / "image.jpg").exists()
-            assert (tmpdir / "Code" / "script.py").exists()
-            assert (tmpdir / "Archives" / "archive.zip").exists()
-            assert (tmpdir / "Documents" / "readme.md").exists()
+
+    def test_organize_reports_each_move(self, capsys):
+        """Without quiet, every move should be reported"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "song.mp3").write_text("audio")
+            (tmpdir / "image.jpg").write_text("image file")
+            
+            organize(str(tmpdir), dry_run=True)
+            
+            out = capsys.readouterr().out
+            assert "song.mp3 → Audio" in out
+            assert "image.jpg → Images" in out
+
+    def test_organize_mixed_file_types(self, workdir):
+        """Multiple file types should be organized into correct categories"""
+        organize(str(workdir), dry_run=False)
+        
+        assert (workdir / "Audio" / "song.mp3").exists()
+        assert (workdir / "Images" / "image.jpg").exists()
+        assert (workdir / "Code" / "script.py").exists()
+        assert (workdir / "Archives" / "archive.zip").exists()
+        assert (workdir / "Documents" / "readme.md").exists()
+        assert (workdir / "Documents" / "document.pdf").exists()
+
+
+class TestHashCache:
+    """Tests for the persistent hash cache"""
+
+    def _make_candidates(self, tmpdir):
+        """Create three same-size files that need a full hash to tell apart"""
+        for name in ("a.bin", "b.bin", "c.bin"):
+            (tmpdir / name).write_bytes(b"x" * PREFIX_SIZE + name[0].encode())
+
+    def test_cache_file_written_and_not_organized(self):
+        """The cache should be saved in the folder and left in place"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            self._make_candidates(tmpdir)
+            
+            organize(str(tmpdir), dry_run=False)
+            organize(str(tmpdir), dry_run=False)
+            
+            cache_data = json.loads((tmpdir / CACHE_FILE).read_text())
+            assert cache_data["algorithm"] == HASH_ALGORITHM
+            assert len(cache_data["digests"]) == 3
+            assert not (tmpdir / "Code" / CACHE_FILE).exists()
+
+    def test_cache_skips_rehashing(self):
+        """A second run should reuse cached digests instead of reading files"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            self._make_candidates(tmpdir)
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            with patch("organize.core.prefix_hash", wraps=prefix_hash) as mock_prefix, \
+                    patch("organize.core._content_hash", wraps=_content_hash) as mock_sha:
+                organize(str(tmpdir), dry_run=False)
+                mock_prefix.assert_not_called()
+                mock_sha.assert_not_called()
+            
+            assert (tmpdir / "Executables" / "a.bin").exists()
+            assert (tmpdir / "Executables" / "b.bin").exists()
+
+    def test_cache_used_when_scan_lacks_inodes(self):
+        """The cache should still work where the scan reports inode 0 (Windows)"""
+        def collect_without_ids(folder, out):
+            entries, skipped = _collect(folder, out)
+            return [(p, n, size, 0, 0, m, c) for p, n, size, _, _, m, c in entries], skipped
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            self._make_candidates(tmpdir)
+            
+            with patch("organize.core._collect", side_effect=collect_without_ids):
+                organize(str(tmpdir), dry_run=False)
+                
+                cache_data = json.loads((tmpdir / CACHE_FILE).read_text())
+                assert len(cache_data["digests"]) == 3
+                
+                with patch("organize.core.prefix_hash", wraps=prefix_hash) as mock_prefix:
+                    organize(str(tmpdir), dry_run=False)
+                    mock_prefix.assert_not_called()
+
+    def test_cache_invalidated_by_modification(self):
+        """Changed files should be hashed again"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            self._make_candidates(tmpdir)
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            moved = tmpdir / "Executables" / "b.bin"
+            moved.write_bytes(b"x" * PREFIX_SIZE + b"a")
+            st = moved.stat()
+            os.utime(moved, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            remaining = list((tmpdir / "Executables").iterdir())
+            assert len(remaining) == 2
+
+    def test_cache_invalidated_by_rewrite_keeping_mtime(self):
+        """A file rewritten in place with its old mtime must not match its stale digest"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            self._make_candidates(tmpdir)
+            old_c = (tmpdir / "c.bin").read_bytes()
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            # Let a coarse ctime clock tick past the first run's renames
+            time.sleep(0.05)
+            moved = tmpdir / "Executables" / "c.bin"
+            st = moved.stat()
+            moved.write_bytes(b"x" * PREFIX_SIZE + b"z")
+            os.utime(moved, ns=(st.st_atime_ns, st.st_mtime_ns))
+            # A new file holding what c.bin used to contain
+            (tmpdir / "d.bin").write_bytes(old_c)
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            assert moved.read_bytes() == b"x" * PREFIX_SIZE + b"z"
+            assert (tmpdir / "Executables" / "d.bin").read_bytes() == old_c
+
+    def test_cache_skips_deleted_duplicates(self):
+        """Digests of deleted duplicates should not be saved, as their inodes may be reused"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            self._make_candidates(tmpdir)
+            (tmpdir / "b.bin").write_bytes((tmpdir / "a.bin").read_bytes())
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            cache_data = json.loads((tmpdir / CACHE_FILE).read_text())
+            assert len(list((tmpdir / "Executables").iterdir())) == 2
+            assert len(cache_data["digests"]) == 2
+
+    def test_cache_ignored_when_corrupted(self):
+        """A corrupted cache should be ignored"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            self._make_candidates(tmpdir)
+            (tmpdir / CACHE_FILE).write_text("{not json")
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            assert (tmpdir / "Executables" / "a.bin").exists()
+            assert (tmpdir / "Executables" / "b.bin").exists()
+
+    def test_dry_run_does_not_write_cache(self):
+        """Dry run should not create the cache file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            self._make_candidates(tmpdir)
+            
+            organize(str(tmpdir), dry_run=True)
+            
+            assert not (tmpdir / CACHE_FILE).exists()
 
 
 class TestFileTypes:
     """Tests for file type definitions"""
 
+    def test_ext_to_cat_covers_file_types(self):
+        """The reverse index should map every extension to its category"""
+        for category_name, extensions in FILE_TYPES.items():
+            for ext in extensions:
+                assert EXT_TO_CAT[ext.lower()] == category_name
+        assert len(EXT_TO_CAT) == sum(len(v) for v in FILE_TYPES.values())
+
     def test_file_types_structure(self):
         """FILE_TYPES should have expected categories"""
         expected_categories = {
@@ -7,8 +7,9 @@ import os
 import pytest
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
-from organize.core import category, organize, LOG_FILE
+from organize.core import category, organize, LOG_FILE, _extension, _scan
 
 
 class TestEdgeCases:
@@ -165,6 +166,79 @@ class TestEdgeCases:
             
             assert (tmpdir / "Documents" / "file.pdf").exists()
 
+    def test_symlinked_directory_not_followed(self):
+        """Symlinked directories should not be traversed"""
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                tempfile.TemporaryDirectory() as outside:
+            tmpdir = Path(tmpdir)
+            outside = Path(outside)
+            
+            (outside / "external.pdf").write_text("outside content unique")
+            try:
+                os.symlink(outside, tmpdir / "link", target_is_directory=True)
+            except (OSError, NotImplementedError):
+                pytest.skip("symlinks not supported on this platform")
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            assert (outside / "external.pdf").exists()
+            assert not (tmpdir / "Documents" / "external.pdf").exists()
+
+    def test_hard_links_detected_without_hashing(self):
+        """Hard links to one file should be treated as duplicates unread"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "original.pdf").write_text("hard linked content")
+            try:
+                os.link(tmpdir / "original.pdf", tmpdir / "link.pdf")
+            except (OSError, NotImplementedError):
+                pytest.skip("hard links not supported on this platform")
+            
+            with patch("organize.core.prefix_hash") as mock_prefix, \
+                    patch("organize.core._content_hash") as mock_sha:
+                organize(str(tmpdir), dry_run=False)
+                mock_prefix.assert_not_called()
+                mock_sha.assert_not_called()
+            
+            remaining = list((tmpdir / "Documents").iterdir())
+            assert len(remaining) == 1
+            assert remaining[0].read_text() == "hard linked content"
+
+    def test_hard_link_matches_identical_copy(self):
+        """A hard link should be a duplicate of a copy of the same content"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "original.pdf").write_text("shared content")
+            (tmpdir / "copy.pdf").write_text("shared content")
+            try:
+                os.link(tmpdir / "original.pdf", tmpdir / "link.pdf")
+            except (OSError, NotImplementedError):
+                pytest.skip("hard links not supported on this platform")
+            
+            organize(str(tmpdir), dry_run=False)
+            
+            assert len(list((tmpdir / "Documents").iterdir())) == 1
+
+    def test_scan_matches_os_walk(self):
+        """The scandir walker should find the same files in the same order"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            
+            (tmpdir / "top.txt").write_text("top")
+            for sub in ("a", "a/b", "a/b/c", "d"):
+                (tmpdir / sub).mkdir()
+                (tmpdir / sub / "file.txt").write_text(sub)
+            (tmpdir / "a" / "extra.pdf").write_text("extra")
+            
+            expected = [
+                os.path.join(root, f)
+                for root, _, files in os.walk(str(tmpdir))
+                for f in files
+            ]
+            assert [entry.path for entry in _scan(str(tmpdir))] == expected
+
     def test_file_conflicts_in_same_operation(self):
         """Multiple files with same name should be numbered correctly"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -233,6 +307,15 @@ class TestEdgeCases:
 class TestCategoryEdgeCases:
     """Edge case tests for category function"""
 
+    def test_extension_matches_splitext(self):
+        """Extension parsing should agree with os.path.splitext"""
+        names = [
+            "file.txt", "archive.tar.gz", "Makefile", ".gitignore",
+            ".hidden.txt", "..double", "trailing.", "a..b", "IMAGE.JPG", "",
+        ]
+        for name in names:
+            assert _extension(name) == os.path.splitext(name)[1], name
+
     def test_category_tar_gz(self):
         """.tar.gz should be recognized as archive"""
         # Testing with the last extension
@@ -3,178 +3,136 @@ Tests for restore functionality (restore.py)
 Tests cover: restoring files to original locations
 """
 
+import os
 import json
 import pytest
-import tempfile
-from pathlib import Path
 
 from organize.restore import restore
 from organize.core import LOG_FILE
 
 
+# Without O_BINARY, Windows would translate newlines in written files
+_WRITE_FLAGS = os.O_CREAT | os.O_WRONLY | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+CONTENT = b"content"
+TEXT = b"text"
+IMAGE = b"image"
+
+
+def _write_bytes(path, data):
+    """
+    Write bytes to a file with raw os calls, skipping the text codec layer.
+    
+    Args:
+        path (Path): File to create or truncate
+        data (bytes): Content to write
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_log(root, moves):
+    """
+    Write a move log for files below root.
+    
+    Args:
+        root (Path): Folder being restored
+        moves (tuple): (from, to) pairs of paths relative to root
+    """
+    log_data = {
+        "timestamp": "2026-02-10T10:00:00",
+        "moves": [{"from": str(root / src), "to": str(root / dest)} for src, dest in moves],
+    }
+    _write_bytes(root / LOG_FILE, json.dumps(log_data).encode())
+
+
+def _stage(root, files):
+    """
+    Create files in their moved locations, as organize would leave them.
+    
+    Each parent directory is created once, however many files it holds.
+    
+    Args:
+        root (Path): Folder being restored
+        files (dict): Maps paths relative to root to their bytes content
+    """
+    made = set()
+    for rel, content in files.items():
+        path = root / rel
+        parent = path.parent
+        if parent not in made:
+            os.makedirs(parent, exist_ok=True)
+            made.add(parent)
+        _write_bytes(path, content)
+
+
+# Each case: moves in the log, files staged at their moved locations, then
+# the files expected afterwards (with content) and paths expected gone
+RESTORE_CASES = [
+    pytest.param(
+        (("file.pdf", "Documents/file.pdf"),),
+        {"Documents/file.pdf": CONTENT},
+        {"file.pdf": CONTENT},
+        ["Documents/file.pdf"],
+        id="basic",
+    ),
+    pytest.param(
+        (("file1.txt", "Documents/file1.txt"), ("file2.jpg", "Images/file2.jpg")),
+        {"Documents/file1.txt": TEXT, "Images/file2.jpg": IMAGE},
+        {"file1.txt": TEXT, "file2.jpg": IMAGE},
+        ["Documents/file1.txt", "Images/file2.jpg"],
+        id="multiple_files",
+    ),
+    # The file no longer exists at its moved location; nothing is restored
+    pytest.param(
+        (("file.pdf", "Documents/file.pdf"),),
+        {},
+        {},
+        ["file.pdf"],
+        id="missing_file",
+    ),
+    pytest.param(
+        (("subdir/file.txt", "Documents/file.txt"),),
+        {"Documents/file.txt": CONTENT},
+        {"subdir/file.txt": CONTENT},
+        ["Documents/file.txt"],
+        id="creates_original_directory",
+    ),
+    pytest.param((), {}, {}, [], id="empty_log"),
+    pytest.param(
+        (("file.txt", "Documents/file.txt"),),
+        {"Documents/file.txt": b"Important data"},
+        {"file.txt": b"Important data"},
+        [],
+        id="preserves_file_content",
+    ),
+]
+
+
 class TestRestore:
     """Tests for restore functionality"""
 
-    def test_restore_basic(self):
-        """Basic file restoration should work"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            
-            # Create log file with move history
-            log_data = {
-                "timestamp": "2026-02-10T10:00:00",
-                "moves": [
-                    {
-                        "from": str(tmpdir / "file.pdf"),
-                        "to": str(tmpdir / "Documents" / "file.pdf")
-                    }
-                ]
-            }
-            
-            (tmpdir / LOG_FILE).write_text(json.dumps(log_data))
-            
-            # Create the file in its moved location
-            (tmpdir / "Documents").mkdir()
-            (tmpdir / "Documents" / "file.pdf").write_text("content")
-            
-            restore(str(tmpdir))
-            
-            # File should be restored to original location
-            assert (tmpdir / "file.pdf").exists()
-            assert not (tmpdir / "Documents" / "file.pdf").exists()
-
-    def test_restore_multiple_files(self):
-        """Multiple files should be restored in reverse order"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            
-            log_data = {
-                "timestamp": "2026-02-10T10:00:00",
-                "moves": [
-                    {
-                        "from": str(tmpdir / "file1.txt"),
-                        "to": str(tmpdir / "Documents" / "file1.txt")
-                    },
-                    {
-                        "from": str(tmpdir / "file2.jpg"),
-                        "to": str(tmpdir / "Images" / "file2.jpg")
-                    }
-                ]
-            }
-            
-            (tmpdir / LOG_FILE).write_text(json.dumps(log_data))
-            
-            # Create moved files
-            (tmpdir / "Documents").mkdir()
-            (tmpdir / "Images").mkdir()
-            (tmpdir / "Documents" / "file1.txt").write_text("text")
-            (tmpdir / "Images" / "file2.jpg").write_text("image")
-            
-            restore(str(tmpdir))
-            
-            # Both files should be restored
-            assert (tmpdir / "file1.txt").exists()
-            assert (tmpdir / "file2.jpg").exists()
-            assert not (tmpdir / "Documents" / "file1.txt").exists()
-            assert not (tmpdir / "Images" / "file2.jpg").exists()
-
-    def test_restore_no_log_file(self):
+    @pytest.mark.parametrize("moves, staged, restored, gone", RESTORE_CASES)
+    def test_restore(self, shm_path, moves, staged, restored, gone):
+        """Logged moves should be undone, skipping files that are missing"""
+        _write_log(shm_path, moves)
+        _stage(shm_path, staged)
+
+        # Should not raise an exception
+        restore(str(shm_path))
+
+        for rel, content in restored.items():
+            assert (shm_path / rel).read_bytes() == content
+        for rel in gone:
+            assert not (shm_path / rel).exists()
+
+    def test_restore_no_log_file(self, shm_path):
         """Restore without log file should handle gracefully"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Should not raise an exception
-            restore(tmpdir)
-
-    def test_restore_missing_file(self):
-        """Restore should handle files that no longer exist at the moved location"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            
-            log_data = {
-                "timestamp": "2026-02-10T10:00:00",
-                "moves": [
-                    {
-                        "from": str(tmpdir / "file.pdf"),
-                        "to": str(tmpdir / "Documents" / "file.pdf")
-                    }
-                ]
-            }
-            
-            (tmpdir / LOG_FILE).write_text(json.dumps(log_data))
-            
-            # File doesn't exist at moved location
-            # Should not raise an exception
-            restore(str(tmpdir))
-            
-            # Original location should not have the file
-            assert not (tmpdir / "file.pdf").exists()
-
-    def test_restore_creates_original_directory(self):
-        """Restore should create original directory if it doesn't exist"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            
-            log_data = {
-                "timestamp": "2026-02-10T10:00:00",
-                "moves": [
-                    {
-                        "from": str(tmpdir / "subdir" / "file.txt"),
-                        "to": str(tmpdir / "Documents" / "file.txt")
-                    }
-                ]
-            }
-            
-            (tmpdir / LOG_FILE).write_text(json.dumps(log_data))
-            
-            (tmpdir / "Documents").mkdir()
-            (tmpdir / "Documents" / "file.txt").write_text("content")
-            
-            restore(str(tmpdir))
-            
-            # Original directory should be created
-            assert (tmpdir / "subdir").exists()
-            assert (tmpdir / "subdir" / "file.txt").exists()
-
-    def test_restore_empty_log(self):
-        """Restore with empty moves list should work"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            
-            log_data = {
-                "timestamp": "2026-02-10T10:00:00",
-                "moves": []
-            }
-            
-            (tmpdir / LOG_FILE).write_text(json.dumps(log_data))
-            
-            # Should not raise an exception
-            restore(str(tmpdir))
-
-    def test_restore_preserves_file_content(self):
-        """Restored files should maintain their original content"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            
-            original_content = "Important data"
-            
-            log_data = {
-                "timestamp": "2026-02-10T10:00:00",
-                "moves": [
-                    {
-                        "from": str(tmpdir / "file.txt"),
-                        "to": str(tmpdir / "Documents" / "file.txt")
-                    }
-                ]
-            }
-            
-            (tmpdir / LOG_FILE).write_text(json.dumps(log_data))
-            
-            (tmpdir / "Documents").mkdir()
-            (tmpdir / "Documents" / "file.txt").write_text(original_content)
-            
-            restore(str(tmpdir))
-            
-            # Content should be preserved
-            assert (tmpdir / "file.txt").read_text() == original_content
+        # Should not raise an exception
+        restore(str(shm_path))
 
 
 if __name__ == "__main__":